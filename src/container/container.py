@@ -1,79 +1,23 @@
 import os
-from typing import Optional
+from functools import lru_cache
+from src.cache.ttl_cache import TTLCache
 from src.db.database import DatabaseConnection
-from src.repository.user_repository import UserRepository
-from src.repository.order_repository import OrderRepository
-from src.repository.notification_repository import NotificationRepository
-from src.services.user_service import UserService
-from src.services.order_service import OrderService
-from src.services.notification_service import NotificationService
+from src.models.models import User
 from src.providers.message_provider import MessageProviderInterface, ConsoleProvider
 
 class DIContainer:
-    def __init__(self, database_url: str):
-        self._database_url = database_url
-        self._database_connection: Optional[DatabaseConnection] = None
-        self._user_repository: Optional[UserRepository] = None
-        self._order_repository: Optional[OrderRepository] = None
-        self._notification_repository: Optional[NotificationRepository] = None
-        self._user_service: Optional[UserService] = None
-        self._order_service: Optional[OrderService] = None
-        self._notification_service: Optional[NotificationService] = None
-        self._message_provider: Optional[MessageProviderInterface] = None
-
-    def get_database_connection(self) -> DatabaseConnection:
-        if self._database_connection is None:
-            self._database_connection = DatabaseConnection(self._database_url)
-        return self._database_connection
-
-    def get_user_repository(self) -> UserRepository:
-        if self._user_repository is None:
-            self._user_repository = UserRepository(self.get_database_connection())
-        return self._user_repository
-
-    def get_order_repository(self) -> OrderRepository:
-        if self._order_repository is None:
-            self._order_repository = OrderRepository(self.get_database_connection())
-        return self._order_repository
-
-    def get_user_service(self) -> UserService:
-        if self._user_service is None:
-            self._user_service = UserService(self.get_user_repository())
-        return self._user_service
-
-    def get_order_service(self) -> OrderService:
-        if self._order_service is None:
-            self._order_service = OrderService(
-                self.get_order_repository(),
-                self.get_user_repository()
-            )
-        return self._order_service
-
-    def get_notification_repository(self) -> NotificationRepository:
-        if self._notification_repository is None:
-            self._notification_repository = NotificationRepository(self.get_database_connection())
-        return self._notification_repository
-
-    def get_message_provider(self) -> MessageProviderInterface:
-        if self._message_provider is None:
-            self._message_provider = ConsoleProvider()
-        return self._message_provider
-
-    def get_notification_service(self) -> NotificationService:
-        if self._notification_service is None:
-            self._notification_service = NotificationService(
-                self.get_notification_repository(),
-                self.get_user_repository(),
-                self.get_message_provider()
-            )
-        return self._notification_service
-
-# Global container
-container: Optional[DIContainer] = None
+    __slots__ = ("database_url", "database_connection", "message_provider", "user_cache", "stats_cache")
 
+    def __init__(self, database_url: str):
+        # Only process-wide resources live here. Repositories and services are
+        # bound to a per-request session and built in dependencies.py.
+        self.database_url = database_url
+        self.database_connection = DatabaseConnection(database_url)
+        self.message_provider: MessageProviderInterface = ConsoleProvider()
+        self.user_cache: TTLCache[User] = TTLCache(maxsize=10_000, ttl=60)
+        self.stats_cache: TTLCache[dict] = TTLCache(maxsize=1, ttl=5)
+
+@lru_cache(maxsize=1)
 def get_container() -> DIContainer:
-    global container
-    if container is None:
-        database_url = os.getenv("DATABASE_URL", "sqlite:///./test.db")
-        container = DIContainer(database_url)
-    return container
+    database_url = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./test.db")
+    return DIContainer(database_url)
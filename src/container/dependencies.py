@@ -1,4 +1,6 @@
-from typing import Generator
+from typing import AsyncIterator
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.container.container import get_container
 from src.services.user_service import UserService
 from src.services.order_service import OrderService
@@ -6,38 +8,72 @@ from src.services.notification_service import NotificationService
 from src.repository.user_repository import UserRepository
 from src.repository.order_repository import OrderRepository
 from src.repository.notification_repository import NotificationRepository
+from src.providers.message_provider import MessageProviderInterface
 from src.db.database import DatabaseConnection
+from src.cache.ttl_cache import TTLCache
+from src.models.models import User
 
-def get_user_service() -> UserService:
-    """FastAPI dependency for UserService"""
-    return get_container().get_user_service()
+# Providers are `async def` so FastAPI resolves them on the event loop
+# instead of offloading each one to the threadpool.
 
-def get_order_service() -> OrderService:
-    """FastAPI dependency for OrderService"""
-    return get_container().get_order_service()
+async def get_database_connection() -> DatabaseConnection:
+    """FastAPI dependency for DatabaseConnection"""
+    return get_container().database_connection
+
+async def get_db_session() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency for database session
+
+    FastAPI caches it per request, so every repository used by a request
+    shares this session and its transaction. Write services commit before
+    returning: depending on the FastAPI version, the teardown below may only
+    run after the response has been sent.
+    """
+    db_connection = get_container().database_connection
+    async with db_connection.get_session() as session:
+        yield session
+
+async def get_message_provider() -> MessageProviderInterface:
+    """FastAPI dependency for MessageProvider"""
+    return get_container().message_provider
+
+async def get_user_cache() -> TTLCache[User]:
+    """FastAPI dependency for the process-wide user lookup cache"""
+    return get_container().user_cache
+
+async def get_stats_cache() -> TTLCache[dict]:
+    """FastAPI dependency for the process-wide admin stats cache"""
+    return get_container().stats_cache
 
-def get_user_repository() -> UserRepository:
+async def get_user_repository(session: AsyncSession = Depends(get_db_session)) -> UserRepository:
     """FastAPI dependency for UserRepository"""
-    return get_container().get_user_repository()
+    return UserRepository(session)
 
-def get_order_repository() -> OrderRepository:
+async def get_order_repository(session: AsyncSession = Depends(get_db_session)) -> OrderRepository:
     """FastAPI dependency for OrderRepository"""
-    return get_container().get_order_repository()
+    return OrderRepository(session)
 
-def get_notification_service() -> NotificationService:
-    """FastAPI dependency for NotificationService"""
-    return get_container().get_notification_service()
-
-def get_notification_repository() -> NotificationRepository:
+async def get_notification_repository(session: AsyncSession = Depends(get_db_session)) -> NotificationRepository:
     """FastAPI dependency for NotificationRepository"""
-    return get_container().get_notification_repository()
+    return NotificationRepository(session)
 
-def get_database_connection() -> DatabaseConnection:
-    """FastAPI dependency for DatabaseConnection"""
-    return get_container().get_database_connection()
+async def get_user_service(
+    user_repository: UserRepository = Depends(get_user_repository)
+) -> UserService:
+    """FastAPI dependency for UserService"""
+    return UserService(user_repository)
 
-def get_db_session() -> Generator:
-    """FastAPI dependency for database session"""
-    db_connection = get_container().get_database_connection()
-    with db_connection.get_session() as session:
-        yield session
+async def get_order_service(
+    order_repository: OrderRepository = Depends(get_order_repository),
+    user_repository: UserRepository = Depends(get_user_repository)
+) -> OrderService:
+    """FastAPI dependency for OrderService"""
+    return OrderService(order_repository, user_repository)
+
+async def get_notification_service(
+    notification_repository: NotificationRepository = Depends(get_notification_repository),
+    user_repository: UserRepository = Depends(get_user_repository),
+    message_provider: MessageProviderInterface = Depends(get_message_provider),
+    user_cache: TTLCache[User] = Depends(get_user_cache)
+) -> NotificationService:
+    """FastAPI dependency for NotificationService"""
+    return NotificationService(notification_repository, user_repository, message_provider, user_cache)
@@ -1,25 +1,52 @@
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from contextlib import contextmanager
+from typing import AsyncIterator
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from contextlib import asynccontextmanager
 from src.models.models import Base
 
 class DatabaseConnection:
-    def __init__(self, database_url: str):
-        self.engine = create_engine(database_url)
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+    """Owns the async engine and its connection pool.
 
-    @contextmanager
-    def get_session(self) -> Session:
-        session = self.SessionLocal()
-        try:
-            yield session
-            session.commit()
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            session.close()
+    SQLite (via aiosqlite) is only meant for local development; production
+    deployments should point DATABASE_URL at PostgreSQL using the asyncpg
+    driver (postgresql+asyncpg://...), where the pool settings apply.
+    """
 
-    def create_tables(self):
-        Base.metadata.create_all(bind=self.engine)
+    def __init__(self, database_url: str, pool_size: int = 20, max_overflow: int = 40, pool_recycle: int = 1800):
+        if database_url.startswith("sqlite"):
+            self.engine = create_async_engine(database_url)
+            event.listen(self.engine.sync_engine, "connect", _enable_sqlite_wal)
+        else:
+            self.engine = create_async_engine(
+                database_url,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_pre_ping=True,
+                pool_recycle=pool_recycle,
+            )
+        # Rows are converted to schemas after the request commits, so keep them loaded
+        self.SessionLocal = async_sessionmaker(bind=self.engine, autoflush=False, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def get_session(self) -> AsyncIterator[AsyncSession]:
+        async with self.SessionLocal() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    async def create_tables(self):
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def dispose(self):
+        await self.engine.dispose()
+
+def _enable_sqlite_wal(dbapi_connection, connection_record):
+    # WAL lets readers proceed while a writer holds the database
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
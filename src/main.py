@@ -1,13 +1,17 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from src.container.container import get_container
 from src.routes import users, orders, admin, notifications
 
-def create_app() -> FastAPI:
-    app = FastAPI(title="E-commerce API with Centralized Dependencies")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    db_connection = get_container().database_connection
+    await db_connection.create_tables()
+    yield
+    await db_connection.dispose()
 
-    container = get_container()
-    db_connection = container.get_database_connection()
-    db_connection.create_tables()
+def create_app() -> FastAPI:
+    app = FastAPI(title="E-commerce API with Centralized Dependencies", lifespan=lifespan)
 
     app.include_router(users.router)
     app.include_router(orders.router)
@@ -19,5 +23,5 @@ def create_app() -> FastAPI:
 app = create_app()
 
 @app.get("/")
-def root():
+async def root():
     return {"message": "E-commerce API with centralized dependencies"}
@@ -1,9 +1,9 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, create_engine
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Index, create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 Base = declarative_base()
 
@@ -23,7 +23,7 @@ class OrderModel(Base):
     __tablename__ = "orders"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"))
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
     total_amount = Column(Float)
     status = Column(String, default="pending")
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -43,6 +43,11 @@ class NotificationModel(Base):
     
     user = relationship("UserModel", back_populates="notifications")
 
+    # Serves keyset pages of a user's notifications without a sort step
+    __table_args__ = (
+        Index("ix_notifications_user_id_id", user_id, id),
+    )
+
 # Pydantic schemas
 class UserCreate(BaseModel):
     username: str
@@ -53,9 +58,8 @@ class User(BaseModel):
     username: str
     email: str
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 class OrderCreate(BaseModel):
     user_id: int
@@ -67,9 +71,8 @@ class Order(BaseModel):
     total_amount: float
     status: str
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 class NotificationCreate(BaseModel):
     user_id: int
@@ -85,6 +88,10 @@ class Notification(BaseModel):
     notification_type: str
     status: str
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
\ No newline at end of file
+
+    model_config = ConfigDict(from_attributes=True)
+
+class AdminStats(BaseModel):
+    total_users: int
+    total_orders: int
+    total_revenue: float
@@ -1,12 +1,21 @@
-from abc import ABC, abstractmethod
-from typing import Dict, Any
+import hashlib
+from typing import Dict, Any, Protocol
 
-class MessageProviderInterface(ABC):
-    @abstractmethod
+def _message_id(recipient: str, title: str, message: str) -> str:
+    # Stable across processes (unlike hash()) and avoids concatenating the parts
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(recipient.encode())
+    digest.update(b"\0")
+    digest.update(title.encode())
+    digest.update(b"\0")
+    digest.update(message.encode())
+    return digest.hexdigest()
+
+class MessageProviderInterface(Protocol):
     def send_message(self, recipient: str, title: str, message: str, message_type: str) -> Dict[str, Any]:
         pass
 
-class EmailProvider(MessageProviderInterface):
+class EmailProvider:
     def send_message(self, recipient: str, title: str, message: str, message_type: str) -> Dict[str, Any]:
         # Email sending implementation would go here
         # For now, we'll return a success response
@@ -14,10 +23,10 @@ class EmailProvider(MessageProviderInterface):
             "success": True,
             "provider": "email",
             "recipient": recipient,
-            "message_id": f"email_{hash(recipient + title + message)}"
+            "message_id": f"email_{_message_id(recipient, title, message)}"
         }
 
-class SMSProvider(MessageProviderInterface):
+class SMSProvider:
     def send_message(self, recipient: str, title: str, message: str, message_type: str) -> Dict[str, Any]:
         # SMS sending implementation would go here
         # For now, we'll return a success response
@@ -25,10 +34,10 @@ class SMSProvider(MessageProviderInterface):
             "success": True,
             "provider": "sms",
             "recipient": recipient,
-            "message_id": f"sms_{hash(recipient + title + message)}"
+            "message_id": f"sms_{_message_id(recipient, title, message)}"
         }
 
-class ConsoleProvider(MessageProviderInterface):
+class ConsoleProvider:
     def send_message(self, recipient: str, title: str, message: str, message_type: str) -> Dict[str, Any]:
         print(f"[{message_type.upper()}] To: {recipient}")
         print(f"Title: {title}")
@@ -38,5 +47,5 @@ class ConsoleProvider(MessageProviderInterface):
             "success": True,
             "provider": "console",
             "recipient": recipient,
-            "message_id": f"console_{hash(recipient + title + message)}"
+            "message_id": f"console_{_message_id(recipient, title, message)}"
         }
\ No newline at end of file
@@ -1,63 +1,96 @@
-from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Protocol
+from sqlalchemy import bindparam, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from src.models.models import NotificationModel, Notification, NotificationCreate
-from src.db.database import DatabaseConnection
 
-class NotificationRepositoryInterface(ABC):
-    @abstractmethod
-    def create_notification(self, notification_data: NotificationCreate) -> NotificationModel:
+_INSERT_NOTIFICATIONS = insert(NotificationModel).returning(NotificationModel, sort_by_parameter_order=True)
+_NOTIFICATIONS_BY_USER = (
+    select(NotificationModel)
+    .where(NotificationModel.user_id == bindparam("user_id"))
+    .order_by(NotificationModel.id.desc())
+    .limit(bindparam("limit"))
+)
+_NOTIFICATIONS_BY_USER_BEFORE = _NOTIFICATIONS_BY_USER.where(NotificationModel.id < bindparam("before_id"))
+
+class NotificationRepositoryInterface(Protocol):
+    async def create_notification(self, notification_data: NotificationCreate) -> NotificationModel:
+        pass
+
+    async def create_notifications_bulk(self, notifications_data: List[NotificationCreate]) -> List[NotificationModel]:
         pass
 
-    @abstractmethod
-    def get_notification_by_id(self, notification_id: int) -> Optional[NotificationModel]:
+    async def get_notification_by_id(self, notification_id: int) -> Optional[NotificationModel]:
         pass
 
-    @abstractmethod
-    def get_notifications_by_user(self, user_id: int) -> List[NotificationModel]:
+    async def get_notification_with_user(self, notification_id: int) -> Optional[NotificationModel]:
         pass
 
-    @abstractmethod
-    def update_notification_status(self, notification_id: int, status: str) -> Optional[NotificationModel]:
+    async def get_notifications_by_user(self, user_id: int, limit: int, before_id: Optional[int] = None) -> List[NotificationModel]:
         pass
 
-    @abstractmethod
-    def delete_notification(self, notification_id: int) -> bool:
+    async def update_notification_status(self, notification_id: int, status: str) -> Optional[NotificationModel]:
         pass
 
-class NotificationRepository(NotificationRepositoryInterface):
-    def __init__(self, db_connection: DatabaseConnection):
-        self.db_connection = db_connection
+    async def delete_notification(self, notification_id: int) -> bool:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+class NotificationRepository:
+    __slots__ = ("session",)
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create_notification(self, notification_data: NotificationCreate) -> NotificationModel:
+        db_notification = NotificationModel(**notification_data.model_dump())
+        self.session.add(db_notification)
+        await self.session.flush()
+        await self.session.refresh(db_notification)
+        return db_notification
+
+    async def create_notifications_bulk(self, notifications_data: List[NotificationCreate]) -> List[NotificationModel]:
+        # A single multi-row INSERT ... RETURNING instead of a flush/refresh per row
+        result = await self.session.scalars(
+            _INSERT_NOTIFICATIONS,
+            [notification_data.model_dump() for notification_data in notifications_data]
+        )
+        return result.all()
+
+    async def get_notification_by_id(self, notification_id: int) -> Optional[NotificationModel]:
+        return await self.session.get(NotificationModel, notification_id)
 
-    def create_notification(self, notification_data: NotificationCreate) -> NotificationModel:
-        with self.db_connection.get_session() as session:
-            db_notification = NotificationModel(**notification_data.dict())
-            session.add(db_notification)
-            session.flush()
-            session.refresh(db_notification)
-            return db_notification
+    async def get_notification_with_user(self, notification_id: int) -> Optional[NotificationModel]:
+        return await self.session.get(NotificationModel, notification_id, options=[joinedload(NotificationModel.user)])
 
-    def get_notification_by_id(self, notification_id: int) -> Optional[NotificationModel]:
-        with self.db_connection.get_session() as session:
-            return session.query(NotificationModel).filter(NotificationModel.id == notification_id).first()
+    async def get_notifications_by_user(self, user_id: int, limit: int, before_id: Optional[int] = None) -> List[NotificationModel]:
+        # Keyset pagination: newest first, resuming below the last id seen
+        if before_id is None:
+            result = await self.session.scalars(_NOTIFICATIONS_BY_USER, {"user_id": user_id, "limit": limit})
+        else:
+            result = await self.session.scalars(
+                _NOTIFICATIONS_BY_USER_BEFORE,
+                {"user_id": user_id, "limit": limit, "before_id": before_id}
+            )
+        return result.all()
 
-    def get_notifications_by_user(self, user_id: int) -> List[NotificationModel]:
-        with self.db_connection.get_session() as session:
-            return session.query(NotificationModel).filter(NotificationModel.user_id == user_id).order_by(NotificationModel.created_at.desc()).all()
+    async def update_notification_status(self, notification_id: int, status: str) -> Optional[NotificationModel]:
+        notification = await self.session.get(NotificationModel, notification_id)
+        if notification:
+            notification.status = status
+            await self.session.flush()
+            await self.session.refresh(notification)
+            return notification
+        return None
 
-    def update_notification_status(self, notification_id: int, status: str) -> Optional[NotificationModel]:
-        with self.db_connection.get_session() as session:
-            notification = session.query(NotificationModel).filter(NotificationModel.id == notification_id).first()
-            if notification:
-                notification.status = status
-                session.flush()
-                session.refresh(notification)
-                return notification
-            return None
+    async def delete_notification(self, notification_id: int) -> bool:
+        notification = await self.session.get(NotificationModel, notification_id)
+        if notification:
+            await self.session.delete(notification)
+            return True
+        return False
 
-    def delete_notification(self, notification_id: int) -> bool:
-        with self.db_connection.get_session() as session:
-            notification = session.query(NotificationModel).filter(NotificationModel.id == notification_id).first()
-            if notification:
-                session.delete(notification)
-                return True
-            return False
\ No newline at end of file
+    async def commit(self) -> None:
+        await self.session.commit()
@@ -1,37 +1,53 @@
-from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple, Protocol
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.models import OrderModel, Order, OrderCreate
-from src.db.database import DatabaseConnection
 
-class OrderRepositoryInterface(ABC):
-    @abstractmethod
-    def create_order(self, order_data: OrderCreate) -> OrderModel:
+_ORDERS_BY_USER = select(OrderModel).where(OrderModel.user_id == bindparam("user_id"))
+_ORDER_STATS = select(
+    func.count(OrderModel.id),
+    func.coalesce(func.sum(OrderModel.total_amount), 0)
+)
+
+class OrderRepositoryInterface(Protocol):
+    async def create_order(self, order_data: OrderCreate) -> OrderModel:
+        pass
+
+    async def get_order_by_id(self, order_id: int) -> Optional[OrderModel]:
         pass
 
-    @abstractmethod
-    def get_order_by_id(self, order_id: int) -> Optional[OrderModel]:
+    async def get_orders_by_user(self, user_id: int) -> List[OrderModel]:
         pass
 
-    @abstractmethod
-    def get_orders_by_user(self, user_id: int) -> List[OrderModel]:
+    async def get_stats(self) -> Tuple[int, float]:
         pass
 
-class OrderRepository(OrderRepositoryInterface):
-    def __init__(self, db_connection: DatabaseConnection):
-        self.db_connection = db_connection
-
-    def create_order(self, order_data: OrderCreate) -> OrderModel:
-        with self.db_connection.get_session() as session:
-            db_order = OrderModel(**order_data.dict())
-            session.add(db_order)
-            session.flush()
-            session.refresh(db_order)
-            return db_order
-
-    def get_order_by_id(self, order_id: int) -> Optional[OrderModel]:
-        with self.db_connection.get_session() as session:
-            return session.query(OrderModel).filter(OrderModel.id == order_id).first()
-
-    def get_orders_by_user(self, user_id: int) -> List[OrderModel]:
-        with self.db_connection.get_session() as session:
-            return session.query(OrderModel).filter(OrderModel.user_id == user_id).all()
+    async def commit(self) -> None:
+        pass
+
+class OrderRepository:
+    __slots__ = ("session",)
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create_order(self, order_data: OrderCreate) -> OrderModel:
+        db_order = OrderModel(**order_data.model_dump())
+        self.session.add(db_order)
+        await self.session.flush()
+        await self.session.refresh(db_order)
+        return db_order
+
+    async def get_order_by_id(self, order_id: int) -> Optional[OrderModel]:
+        return await self.session.get(OrderModel, order_id)
+
+    async def get_orders_by_user(self, user_id: int) -> List[OrderModel]:
+        result = await self.session.scalars(_ORDERS_BY_USER, {"user_id": user_id})
+        return result.all()
+
+    async def get_stats(self) -> Tuple[int, float]:
+        result = await self.session.execute(_ORDER_STATS)
+        return result.one()
+
+    async def commit(self) -> None:
+        await self.session.commit()
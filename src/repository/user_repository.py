@@ -1,50 +1,75 @@
-from abc import ABC, abstractmethod
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import Iterable, List, Optional, Protocol
+from sqlalchemy import bindparam, exists, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.models import UserModel, User, UserCreate
-from src.db.database import DatabaseConnection
 
-class UserRepositoryInterface(ABC):
-    @abstractmethod
-    def create_user(self, user_data: UserCreate) -> UserModel:
+# Statements are built once at import; each call only binds its parameters
+_USER_EXISTS = select(exists().where(UserModel.id == bindparam("user_id")))
+_USERS_BY_IDS = select(UserModel).where(UserModel.id.in_(bindparam("user_ids", expanding=True)))
+_ALL_USERS = select(UserModel)
+_COUNT_USERS = select(func.count(UserModel.id))
+
+class UserRepositoryInterface(Protocol):
+    async def create_user(self, user_data: UserCreate) -> UserModel:
+        pass
+
+    async def get_user_by_id(self, user_id: int) -> Optional[UserModel]:
+        pass
+
+    async def user_exists(self, user_id: int) -> bool:
+        pass
+
+    async def get_users_by_ids(self, user_ids: Iterable[int]) -> List[UserModel]:
         pass
 
-    @abstractmethod
-    def get_user_by_id(self, user_id: int) -> Optional[UserModel]:
+    async def get_all_users(self) -> List[UserModel]:
         pass
 
-    @abstractmethod
-    def get_all_users(self) -> List[UserModel]:
+    async def count_users(self) -> int:
         pass
 
-    @abstractmethod
-    def delete_user(self, user_id: int) -> bool:
+    async def delete_user(self, user_id: int) -> bool:
         pass
 
-class UserRepository(UserRepositoryInterface):
-    def __init__(self, db_connection: DatabaseConnection):
-        self.db_connection = db_connection
+    async def commit(self) -> None:
+        pass
+
+class UserRepository:
+    __slots__ = ("session",)
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create_user(self, user_data: UserCreate) -> UserModel:
+        db_user = UserModel(**user_data.model_dump())
+        self.session.add(db_user)
+        await self.session.flush()
+        await self.session.refresh(db_user)
+        return db_user
+
+    async def get_user_by_id(self, user_id: int) -> Optional[UserModel]:
+        return await self.session.get(UserModel, user_id)
+
+    async def user_exists(self, user_id: int) -> bool:
+        return await self.session.scalar(_USER_EXISTS, {"user_id": user_id})
+
+    async def get_users_by_ids(self, user_ids: Iterable[int]) -> List[UserModel]:
+        result = await self.session.scalars(_USERS_BY_IDS, {"user_ids": list(user_ids)})
+        return result.all()
 
-    def create_user(self, user_data: UserCreate) -> UserModel:
-        with self.db_connection.get_session() as session:
-            db_user = UserModel(**user_data.dict())
-            session.add(db_user)
-            session.flush()
-            session.refresh(db_user)
-            return db_user
+    async def get_all_users(self) -> List[UserModel]:
+        result = await self.session.scalars(_ALL_USERS)
+        return result.all()
 
-    def get_user_by_id(self, user_id: int) -> Optional[UserModel]:
-        with self.db_connection.get_session() as session:
-            return session.query(UserModel).filter(UserModel.id == user_id).first()
+    async def count_users(self) -> int:
+        return await self.session.scalar(_COUNT_USERS)
 
-    def get_all_users(self) -> List[UserModel]:
-        with self.db_connection.get_session() as session:
-            return session.query(UserModel).all()
+    async def delete_user(self, user_id: int) -> bool:
+        user = await self.session.get(UserModel, user_id)
+        if user:
+            await self.session.delete(user)
+            return True
+        return False
 
-    def delete_user(self, user_id: int) -> bool:
-        with self.db_connection.get_session() as session:
-            user = session.query(UserModel).filter(UserModel.id == user_id).first()
-            if user:
-                session.delete(user)
-                return True
-            return False
+    async def commit(self) -> None:
+        await self.session.commit()
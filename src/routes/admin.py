@@ -1,34 +1,38 @@
 from fastapi import APIRouter, Depends
 from typing import List
-from src.container.dependencies import get_user_service, get_order_service
+from src.cache.ttl_cache import TTLCache
+from src.container.dependencies import get_user_service, get_order_service, get_stats_cache
 from src.services.user_service import UserService
 from src.services.order_service import OrderService
-from src.models.models import User, Order
+from src.models.models import AdminStats, User, Order
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 @router.get("/users/", response_model=List[User])
-def admin_get_all_users(
+async def admin_get_all_users(
     user_service: UserService = Depends(get_user_service)
 ):
     """Admin endpoint to get all users"""
-    return user_service.get_all_users()
+    return await user_service.get_all_users()
 
-@router.get("/stats/")
-def admin_get_stats(
+@router.get("/stats/", response_model=AdminStats)
+async def admin_get_stats(
     user_service: UserService = Depends(get_user_service),
-    order_service: OrderService = Depends(get_order_service)
+    order_service: OrderService = Depends(get_order_service),
+    stats_cache: TTLCache[dict] = Depends(get_stats_cache)
 ):
-    """Admin endpoint to get system stats"""
-    users = user_service.get_all_users()
+    """Admin endpoint to get system stats
 
-    all_orders = []
-    for user in users:
-        orders = order_service.get_user_orders(user.id)
-        all_orders.extend(orders)
-
-    return {
-        "total_users": len(users),
-        "total_orders": len(all_orders),
-        "total_revenue": sum(order.total_amount for order in all_orders)
-    }
+    Dashboards poll this far more often than the numbers change, so the
+    result is cached for a few seconds.
+    """
+    stats = stats_cache.get("stats")
+    if stats is None:
+        total_orders, total_revenue = await order_service.get_order_stats()
+        stats = {
+            "total_users": await user_service.count_users(),
+            "total_orders": total_orders,
+            "total_revenue": total_revenue
+        }
+        stats_cache.set("stats", stats)
+    return stats
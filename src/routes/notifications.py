@@ -1,64 +1,85 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
+from fastapi import APIRouter, Body, HTTPException, Depends, Query
+from typing import List, Optional
 from src.container.dependencies import get_notification_service
 from src.services.notification_service import NotificationService
 from src.models.models import Notification, NotificationCreate
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
+# Upper bound on one bulk request, which is inserted and sent in a single go
+MAX_BULK_NOTIFICATIONS = 100
+# Page sizes for a user's notification list; the service and repository take the limit from here
+NOTIFICATIONS_PAGE_SIZE = 50
+MAX_NOTIFICATIONS_PAGE_SIZE = 100
+
 @router.post("/", response_model=Notification)
-def create_notification(
+async def create_notification(
     notification_data: NotificationCreate,
     notification_service: NotificationService = Depends(get_notification_service)
 ):
     """Create a new notification and send it"""
     try:
-        return notification_service.create_notification(notification_data)
+        return await notification_service.create_notification(notification_data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/bulk", response_model=List[Notification])
+async def create_notifications(
+    notifications_data: List[NotificationCreate] = Body(..., max_length=MAX_BULK_NOTIFICATIONS),
+    notification_service: NotificationService = Depends(get_notification_service)
+):
+    """Create several notifications at once and send them"""
+    try:
+        return await notification_service.create_notifications(notifications_data)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{notification_id}", response_model=Notification)
-def get_notification(
+async def get_notification(
     notification_id: int,
     notification_service: NotificationService = Depends(get_notification_service)
 ):
     """Get notification by ID"""
-    notification = notification_service.get_notification(notification_id)
+    notification = await notification_service.get_notification(notification_id)
     if not notification:
         raise HTTPException(status_code=404, detail="Notification not found")
     return notification
 
 @router.get("/user/{user_id}", response_model=List[Notification])
-def get_user_notifications(
+async def get_user_notifications(
     user_id: int,
+    limit: int = Query(NOTIFICATIONS_PAGE_SIZE, ge=1, le=MAX_NOTIFICATIONS_PAGE_SIZE),
+    before_id: Optional[int] = None,
     notification_service: NotificationService = Depends(get_notification_service)
 ):
-    """Get all notifications for a user"""
-    return notification_service.get_user_notifications(user_id)
+    """Get a user's notifications, newest first
+
+    Pass the smallest id of the previous page as `before_id` to fetch the next one.
+    """
+    return await notification_service.get_user_notifications(user_id, limit, before_id)
 
 @router.put("/{notification_id}/read", response_model=Notification)
-def mark_notification_as_read(
+async def mark_notification_as_read(
     notification_id: int,
     notification_service: NotificationService = Depends(get_notification_service)
 ):
     """Mark a notification as read"""
-    notification = notification_service.mark_as_read(notification_id)
+    notification = await notification_service.mark_as_read(notification_id)
     if not notification:
         raise HTTPException(status_code=404, detail="Notification not found")
     return notification
 
 @router.post("/{notification_id}/resend")
-def resend_notification(
+async def resend_notification(
     notification_id: int,
     notification_service: NotificationService = Depends(get_notification_service)
 ):
     """Resend a notification message"""
-    notification = notification_service.get_notification(notification_id)
-    if not notification:
-        raise HTTPException(status_code=404, detail="Notification not found")
-    
     try:
-        result = notification_service.send_notification_message(notification)
-        return {"message": "Notification resent successfully", "result": result}
+        result = await notification_service.resend_notification(notification_id)
     except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if result is None:
+        raise HTTPException(status_code=404, detail="Notification not found")
+    return {"message": "Notification resent successfully", "result": result}
\ No newline at end of file
@@ -1,67 +1,110 @@
-from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Union, Protocol
+from src.cache.ttl_cache import TTLCache
 from src.repository.notification_repository import NotificationRepositoryInterface
 from src.repository.user_repository import UserRepositoryInterface
 from src.providers.message_provider import MessageProviderInterface
-from src.models.models import Notification, NotificationCreate
+from src.models.models import Notification, NotificationCreate, User, UserModel
 
-class NotificationServiceInterface(ABC):
-    @abstractmethod
-    def create_notification(self, notification_data: NotificationCreate, send_message: bool = True) -> Notification:
+class NotificationServiceInterface(Protocol):
+    async def create_notification(self, notification_data: NotificationCreate, send_message: bool = True) -> Notification:
         pass
 
-    @abstractmethod
-    def get_notification(self, notification_id: int) -> Optional[Notification]:
+    async def create_notifications(self, notifications_data: List[NotificationCreate], send_message: bool = True) -> List[Notification]:
         pass
 
-    @abstractmethod
-    def get_user_notifications(self, user_id: int) -> List[Notification]:
+    async def get_notification(self, notification_id: int) -> Optional[Notification]:
         pass
 
-    @abstractmethod
-    def mark_as_read(self, notification_id: int) -> Optional[Notification]:
+    async def get_user_notifications(self, user_id: int, limit: int, before_id: Optional[int] = None) -> List[Notification]:
         pass
 
-    @abstractmethod
-    def send_notification_message(self, notification: Notification) -> dict:
+    async def mark_as_read(self, notification_id: int) -> Optional[Notification]:
         pass
 
-class NotificationService(NotificationServiceInterface):
+    async def resend_notification(self, notification_id: int) -> Optional[dict]:
+        pass
+
+    async def send_notification_message(self, notification: Notification, user: Optional[Union[User, UserModel]] = None) -> dict:
+        pass
+
+class NotificationService:
+    __slots__ = ("notification_repository", "user_repository", "message_provider", "user_cache")
+
     def __init__(self, 
                  notification_repository: NotificationRepositoryInterface,
                  user_repository: UserRepositoryInterface,
-                 message_provider: MessageProviderInterface):
+                 message_provider: MessageProviderInterface,
+                 user_cache: TTLCache[User]):
         self.notification_repository = notification_repository
         self.user_repository = user_repository
         self.message_provider = message_provider
+        self.user_cache = user_cache
 
-    def create_notification(self, notification_data: NotificationCreate, send_message: bool = True) -> Notification:
-        user = self.user_repository.get_user_by_id(notification_data.user_id)
-        if not user:
+    async def create_notification(self, notification_data: NotificationCreate, send_message: bool = True) -> Notification:
+        # Existence is always checked against the database, never the cache; when
+        # sending, the one lookup also yields the recipient and refreshes the cache
+        if send_message:
+            user = await self._load_recipient(notification_data.user_id)
+            user_found = user is not None
+        else:
+            user_found = await self.user_repository.user_exists(notification_data.user_id)
+        if not user_found:
             raise ValueError(f"User with ID {notification_data.user_id} not found")
 
-        db_notification = self.notification_repository.create_notification(notification_data)
-        notification = Notification.from_orm(db_notification)
+        db_notification = await self.notification_repository.create_notification(notification_data)
+        await self.notification_repository.commit()
+        notification = Notification.model_validate(db_notification)
         
         if send_message:
-            self.send_notification_message(notification)
+            await self.send_notification_message(notification, user)
         
         return notification
 
-    def get_notification(self, notification_id: int) -> Optional[Notification]:
-        db_notification = self.notification_repository.get_notification_by_id(notification_id)
-        return Notification.from_orm(db_notification) if db_notification else None
+    async def create_notifications(self, notifications_data: List[NotificationCreate], send_message: bool = True) -> List[Notification]:
+        if not notifications_data:
+            return []
+
+        user_ids = {notification_data.user_id for notification_data in notifications_data}
+        users = {user.id: user for user in await self.user_repository.get_users_by_ids(user_ids)}
+        missing_ids = user_ids - users.keys()
+        if missing_ids:
+            raise ValueError(f"Users with IDs {sorted(missing_ids)} not found")
 
-    def get_user_notifications(self, user_id: int) -> List[Notification]:
-        db_notifications = self.notification_repository.get_notifications_by_user(user_id)
-        return [Notification.from_orm(notification) for notification in db_notifications]
+        db_notifications = await self.notification_repository.create_notifications_bulk(notifications_data)
+        await self.notification_repository.commit()
+        notifications = [Notification.model_validate(notification) for notification in db_notifications]
 
-    def mark_as_read(self, notification_id: int) -> Optional[Notification]:
-        db_notification = self.notification_repository.update_notification_status(notification_id, "read")
-        return Notification.from_orm(db_notification) if db_notification else None
+        if send_message:
+            for notification in notifications:
+                await self.send_notification_message(notification, users[notification.user_id])
+
+        return notifications
+
+    async def get_notification(self, notification_id: int) -> Optional[Notification]:
+        db_notification = await self.notification_repository.get_notification_by_id(notification_id)
+        return Notification.model_validate(db_notification) if db_notification else None
+
+    async def get_user_notifications(self, user_id: int, limit: int, before_id: Optional[int] = None) -> List[Notification]:
+        db_notifications = await self.notification_repository.get_notifications_by_user(user_id, limit, before_id)
+        return [Notification.model_validate(notification) for notification in db_notifications]
 
-    def send_notification_message(self, notification: Notification) -> dict:
-        user = self.user_repository.get_user_by_id(notification.user_id)
+    async def mark_as_read(self, notification_id: int) -> Optional[Notification]:
+        db_notification = await self.notification_repository.update_notification_status(notification_id, "read")
+        if not db_notification:
+            return None
+        await self.notification_repository.commit()
+        return Notification.model_validate(db_notification)
+
+    async def resend_notification(self, notification_id: int) -> Optional[dict]:
+        db_notification = await self.notification_repository.get_notification_with_user(notification_id)
+        if not db_notification:
+            return None
+        return await self.send_notification_message(Notification.model_validate(db_notification), db_notification.user)
+
+    async def send_notification_message(self, notification: Notification, user: Optional[Union[User, UserModel]] = None) -> dict:
+        # Callers that already loaded the recipient pass it in to skip the lookup
+        if user is None:
+            user = await self._get_recipient(notification.user_id)
         if not user:
             raise ValueError(f"User with ID {notification.user_id} not found")
         
@@ -70,4 +113,22 @@ class NotificationService(NotificationServiceInterface):
             title=notification.title,
             message=notification.message,
             message_type=notification.notification_type
-        )
\ No newline at end of file
+        )
+
+    async def _get_recipient(self, user_id: int) -> Optional[User]:
+        # Only used for delivery details such as the email; a stale entry can
+        # at worst address a message to an outdated email for one TTL window
+        user = self.user_cache.get(user_id)
+        if user is None:
+            user = await self._load_recipient(user_id)
+        return user
+
+    async def _load_recipient(self, user_id: int) -> Optional[User]:
+        # Always reads the database and brings the cache in line with it
+        db_user = await self.user_repository.get_user_by_id(user_id)
+        if not db_user:
+            self.user_cache.invalidate(user_id)
+            return None
+        user = User.model_validate(db_user)
+        self.user_cache.set(user_id, user)
+        return user
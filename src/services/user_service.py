@@ -1,33 +1,44 @@
-from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Protocol
 from src.repository.user_repository import UserRepositoryInterface
 from src.models.models import User, UserCreate
 
-class UserServiceInterface(ABC):
-    @abstractmethod
-    def create_user(self, user_data: UserCreate) -> User:
+class UserServiceInterface(Protocol):
+    async def create_user(self, user_data: UserCreate) -> User:
         pass
 
-    @abstractmethod
-    def get_user(self, user_id: int) -> Optional[User]:
+    async def get_user(self, user_id: int) -> Optional[User]:
         pass
 
-    @abstractmethod
-    def get_all_users(self) -> List[User]:
+    async def user_exists(self, user_id: int) -> bool:
         pass
 
-class UserService(UserServiceInterface):
+    async def get_all_users(self) -> List[User]:
+        pass
+
+    async def count_users(self) -> int:
+        pass
+
+class UserService:
+    __slots__ = ("user_repository",)
+
     def __init__(self, user_repository: UserRepositoryInterface):
         self.user_repository = user_repository
 
-    def create_user(self, user_data: UserCreate) -> User:
-        db_user = self.user_repository.create_user(user_data)
-        return User.from_orm(db_user)
+    async def create_user(self, user_data: UserCreate) -> User:
+        db_user = await self.user_repository.create_user(user_data)
+        await self.user_repository.commit()
+        return User.model_validate(db_user)
+
+    async def get_user(self, user_id: int) -> Optional[User]:
+        db_user = await self.user_repository.get_user_by_id(user_id)
+        return User.model_validate(db_user) if db_user else None
+
+    async def user_exists(self, user_id: int) -> bool:
+        return await self.user_repository.user_exists(user_id)
 
-    def get_user(self, user_id: int) -> Optional[User]:
-        db_user = self.user_repository.get_user_by_id(user_id)
-        return User.from_orm(db_user) if db_user else None
+    async def get_all_users(self) -> List[User]:
+        db_users = await self.user_repository.get_all_users()
+        return [User.model_validate(user) for user in db_users]
 
-    def get_all_users(self) -> List[User]:
-        db_users = self.user_repository.get_all_users()
-        return [User.from_orm(user) for user in db_users]
+    async def count_users(self) -> int:
+        return await self.user_repository.count_users()
@@ -0,0 +1,15 @@
+import pytest
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run every anyio test on asyncio"""
+    return "asyncio"
+
+@pytest.fixture(scope="session", autouse=True)
+async def _session_event_loop(anyio_backend):
+    """Hold anyio's runner for the whole run so every test shares one event loop
+
+    anyio only keeps a runner, and its loop, alive while some async fixture or
+    test holds it; this fixture holds it from the first test to the last.
+    """
+    yield
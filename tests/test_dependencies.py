@@ -1,46 +1,142 @@
-from unittest.mock import Mock
-from fastapi.testclient import TestClient
-from src.container.dependencies import get_user_service, get_order_service
-from src.services.user_service import UserService
-from src.services.order_service import OrderService
+import json
+import pytest
+from unittest.mock import patch
+from httpx import ASGITransport, AsyncClient
+from pydantic import TypeAdapter
+from src.cache.ttl_cache import TTLCache
+from src.container.dependencies import get_user_service, get_order_service, get_stats_cache
 from src.main import app
+from src.routes import users
 
-def test_dependency_override():
-    """Test overriding dependencies for testing"""
-    mock_user_service = Mock(spec=UserService)
-    mock_user_service.get_all_users.return_value = [
-        {"id": 1, "username": "testuser", "email": "test@example.com", "created_at": "2023-10-01T00:00:00Z"}
-    ]
+_USERS = [
+    {"id": 1, "username": "testuser", "email": "test@example.com", "created_at": "2023-10-01T00:00:00Z"}
+]
+_EXPECTED_STATS = {"total_users": 0, "total_orders": 0, "total_revenue": 0.0}
+# Responses are compact, non-ASCII-escaping JSON in key order, matching these bytes
+_USERS_BYTES = json.dumps(_USERS, separators=(",", ":"), ensure_ascii=False).encode()
+_EXPECTED_STATS_BYTES = json.dumps(_EXPECTED_STATS, separators=(",", ":"), ensure_ascii=False).encode()
 
-    app.dependency_overrides[get_user_service] = lambda: mock_user_service
+class _StubUserService:
+    """Minimal UserService stand-in that appends each method it runs to calls"""
 
-    client = TestClient(app)
-    response = client.get("/users/")
+    def __init__(self, calls, users=(), user_count=0):
+        self.calls = calls
+        self.users = list(users)
+        self.user_count = user_count
 
-    assert response.status_code == 200
-    mock_user_service.get_all_users.assert_called_once()
+    async def get_all_users(self):
+        self.calls.append("get_all_users")
+        return self.users
 
-    app.dependency_overrides.clear()
+    async def count_users(self):
+        self.calls.append("count_users")
+        return self.user_count
 
-def test_multiple_dependencies():
-    """Test endpoint using multiple dependencies"""
-    mock_user_service = Mock(spec=UserService)
-    mock_order_service = Mock(spec=OrderService)
+class _StubOrderService:
+    """Minimal OrderService stand-in that appends each method it runs to calls"""
 
-    mock_user_service.get_all_users.return_value = []
-    mock_order_service.get_user_orders.return_value = []
+    def __init__(self, calls, stats=(0, 0)):
+        self.calls = calls
+        self.stats = stats
 
-    app.dependency_overrides[get_user_service] = lambda: mock_user_service
-    app.dependency_overrides[get_order_service] = lambda: mock_order_service
+    async def get_order_stats(self):
+        self.calls.append("get_order_stats")
+        return self.stats
 
-    client = TestClient(app)
-    response = client.get("/admin/stats/")
+@pytest.fixture(scope="module")
+async def client(anyio_backend):
+    """One client (and app lifespan) shared by every test in the module"""
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+            await _prewarm(c)
+            yield c
 
-    assert response.status_code == 200
-    assert response.json() == {
-        "total_users": 0,
-        "total_orders": 0,
-        "total_revenue": 0
-    }
+async def _prewarm(client):
+    """Hit each route once with stubbed services so first-request setup is not charged to a test"""
+    saved = dict(app.dependency_overrides)
+    try:
+        for case_factory, url in ((_user_list_case, "/users/"), (_stats_case, "/admin/stats/")):
+            app.dependency_overrides.update(case_factory([]))
+            await client.get(url)
+    finally:
+        app.dependency_overrides.clear()
+        app.dependency_overrides.update(saved)
 
+@pytest.fixture(autouse=True)
+def _reset_overrides():
+    """Restore dependency overrides even when a test fails midway"""
+    saved = dict(app.dependency_overrides)
+    yield
     app.dependency_overrides.clear()
+    app.dependency_overrides.update(saved)
+
+def _user_list_case(calls):
+    user_service = _StubUserService(calls, users=_USERS)
+    return {get_user_service: lambda: user_service}
+
+def _stats_case(calls):
+    user_service = _StubUserService(calls, user_count=0)
+    order_service = _StubOrderService(calls, stats=(0, 0))
+    return {
+        get_user_service: lambda: user_service,
+        get_order_service: lambda: order_service,
+        get_stats_cache: lambda: TTLCache(maxsize=1, ttl=5),
+    }
+
+async def _run_case(client, overrides, url, expected_status, expected_body=None):
+    app.dependency_overrides.update(overrides)
+
+    response = await client.get(url)
+
+    assert response.status_code == expected_status
+    if expected_body is not None:
+        assert response.content == expected_body
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("case_factory,url,expected,expected_calls", [
+    pytest.param(_user_list_case, "/users/", _USERS_BYTES, ["get_all_users"], id="dependency_override"),
+    pytest.param(
+        _stats_case, "/admin/stats/", _EXPECTED_STATS_BYTES, ["get_order_stats", "count_users"],
+        id="multiple_dependencies",
+    ),
+])
+async def test_dependency_overrides(client, case_factory, url, expected, expected_calls):
+    """Test that overridden services are the ones an endpoint uses"""
+    calls = []
+
+    await _run_case(client, case_factory(calls), url, 200, expected)
+
+    assert calls == expected_calls
+
+@pytest.mark.anyio
+async def test_get_users_endpoint_direct():
+    """Test that the /users/ handler's output satisfies the route's response_model, without HTTP"""
+    route = next(r for r in users.router.routes if r.endpoint is users.get_users)
+    response_adapter = TypeAdapter(route.response_model)
+    calls = []
+
+    result = await route.endpoint(user_service=_StubUserService(calls, users=_USERS))
+
+    assert response_adapter.dump_json(response_adapter.validate_python(result)) == _USERS_BYTES
+    assert calls == ["get_all_users"]
+
+@pytest.mark.anyio
+async def test_admin_stats_cached_within_ttl(client):
+    """Test that /admin/stats/ queries the services once per TTL window"""
+    calls = []
+    stats_cache = TTLCache(maxsize=1, ttl=5)
+    app.dependency_overrides.update(_stats_case(calls))
+    app.dependency_overrides[get_stats_cache] = lambda: stats_cache
+
+    # Only the cache's clock is frozen; the event loop keeps the real one
+    with patch("src.cache.ttl_cache.time") as clock:
+        clock.monotonic.return_value = 100.0
+        first = await client.get("/admin/stats/")
+        second = await client.get("/admin/stats/")
+        assert calls == ["get_order_stats", "count_users"]
+
+        clock.monotonic.return_value = 105.0
+        third = await client.get("/admin/stats/")
+
+    assert calls == ["get_order_stats", "count_users"] * 2
+    assert first.content == second.content == third.content == _EXPECTED_STATS_BYTES
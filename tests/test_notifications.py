@@ -0,0 +1,145 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+from src.cache.ttl_cache import TTLCache
+from src.container.dependencies import get_db_session, get_message_provider, get_user_cache
+from src.db.database import DatabaseConnection
+from src.main import app
+from src.routes.notifications import MAX_BULK_NOTIFICATIONS, NOTIFICATIONS_PAGE_SIZE
+
+class _RecordingProvider:
+    """Message provider that keeps sent messages instead of delivering them"""
+
+    def __init__(self):
+        self.sent = []
+
+    def send_message(self, recipient, title, message, message_type):
+        self.sent.append((recipient, title))
+        return {"success": True, "provider": "recording", "recipient": recipient}
+
+@pytest.fixture
+def provider():
+    return _RecordingProvider()
+
+@pytest.fixture
+async def client(tmp_path, provider, anyio_backend):
+    """Client backed by a throwaway SQLite database"""
+    db_connection = DatabaseConnection(f"sqlite+aiosqlite:///{tmp_path / 'notifications.db'}")
+    await db_connection.create_tables()
+
+    async def get_test_session():
+        async with db_connection.get_session() as session:
+            yield session
+
+    saved = dict(app.dependency_overrides)
+    app.dependency_overrides[get_db_session] = get_test_session
+    app.dependency_overrides[get_message_provider] = lambda: provider
+    app.dependency_overrides[get_user_cache] = lambda: TTLCache(maxsize=100, ttl=60)
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+            yield c
+    finally:
+        app.dependency_overrides.clear()
+        app.dependency_overrides.update(saved)
+        await db_connection.dispose()
+
+async def _create_user(client, username="alice"):
+    response = await client.post("/users/", json={"username": username, "email": f"{username}@example.com"})
+    assert response.status_code == 200
+    return response.json()["id"]
+
+def _notification(user_id, title="Hello"):
+    return {"user_id": user_id, "title": title, "message": "Body", "notification_type": "email"}
+
+@pytest.mark.anyio
+async def test_create_notification(client, provider):
+    """Test that a single notification is stored and sent to the user's email"""
+    alice = await _create_user(client)
+
+    response = await client.post("/notifications/", json=_notification(alice))
+    unknown = await client.post("/notifications/", json=_notification(alice + 1))
+
+    assert response.status_code == 200
+    assert response.json()["user_id"] == alice
+    assert unknown.status_code == 400
+    assert provider.sent == [("alice@example.com", "Hello")]
+
+@pytest.mark.anyio
+async def test_bulk_create_notifications(client, provider):
+    """Test that a bulk request stores every notification and sends each one"""
+    alice = await _create_user(client, "alice")
+    bob = await _create_user(client, "bob")
+
+    response = await client.post("/notifications/bulk", json=[_notification(alice, "A"), _notification(bob, "B")])
+
+    assert response.status_code == 200
+    created = response.json()
+    assert [(n["user_id"], n["title"]) for n in created] == [(alice, "A"), (bob, "B")]
+    assert provider.sent == [("alice@example.com", "A"), ("bob@example.com", "B")]
+    for notification in created:
+        stored = await client.get(f"/notifications/{notification['id']}")
+        assert stored.status_code == 200
+
+@pytest.mark.anyio
+async def test_bulk_create_empty_list(client, provider):
+    """Test that an empty bulk request creates and sends nothing"""
+    response = await client.post("/notifications/bulk", json=[])
+
+    assert response.status_code == 200
+    assert response.json() == []
+    assert provider.sent == []
+
+@pytest.mark.anyio
+async def test_bulk_create_unknown_user(client, provider):
+    """Test that one unknown user_id rejects the whole batch"""
+    alice = await _create_user(client)
+
+    response = await client.post("/notifications/bulk", json=[_notification(alice), _notification(alice + 1)])
+
+    assert response.status_code == 400
+    assert provider.sent == []
+    notifications = await client.get(f"/notifications/user/{alice}")
+    assert notifications.json() == []
+
+@pytest.mark.anyio
+async def test_bulk_create_rejects_oversized_batch(client, provider):
+    """Test that batches above MAX_BULK_NOTIFICATIONS are refused before touching the database"""
+    alice = await _create_user(client)
+
+    response = await client.post("/notifications/bulk", json=[_notification(alice)] * (MAX_BULK_NOTIFICATIONS + 1))
+
+    assert response.status_code == 422
+    assert provider.sent == []
+
+@pytest.mark.anyio
+async def test_user_notifications_pages_with_before_id(client):
+    """Test walking a user's notifications newest first, page by page, without gaps or duplicates"""
+    alice = await _create_user(client, "alice")
+    bob = await _create_user(client, "bob")
+    batch = [_notification(alice, f"A{i}") for i in range(5)] + [_notification(bob, "B")]
+    created = (await client.post("/notifications/bulk", json=batch)).json()
+    alice_ids = [n["id"] for n in created if n["user_id"] == alice]
+
+    first = (await client.get(f"/notifications/user/{alice}", params={"limit": 3})).json()
+    second = (await client.get(
+        f"/notifications/user/{alice}", params={"limit": 3, "before_id": first[-1]["id"]}
+    )).json()
+    third = (await client.get(
+        f"/notifications/user/{alice}", params={"limit": 3, "before_id": second[-1]["id"]}
+    )).json()
+
+    assert len(first) == 3
+    assert len(second) == 2
+    assert third == []
+    assert [n["id"] for n in first + second] == sorted(alice_ids, reverse=True)
+
+@pytest.mark.anyio
+async def test_user_notifications_default_page_size(client):
+    """Test that without a limit only the newest NOTIFICATIONS_PAGE_SIZE notifications are returned"""
+    alice = await _create_user(client)
+    created = (await client.post(
+        "/notifications/bulk", json=[_notification(alice)] * (NOTIFICATIONS_PAGE_SIZE + 1)
+    )).json()
+
+    page = (await client.get(f"/notifications/user/{alice}")).json()
+
+    assert [n["id"] for n in page] == sorted((n["id"] for n in created), reverse=True)[:NOTIFICATIONS_PAGE_SIZE]
@@ -0,0 +1,56 @@
+from unittest.mock import patch
+from src.cache.ttl_cache import TTLCache
+
+def _at(now):
+    """Freeze the cache's clock at `now`"""
+    return patch("src.cache.ttl_cache.time.monotonic", return_value=now)
+
+def test_entry_expires_after_ttl():
+    """Test that an entry is served until its TTL elapses, then dropped"""
+    cache = TTLCache(maxsize=10, ttl=5)
+    with _at(100.0):
+        cache.set("key", "value")
+    with _at(104.9):
+        assert cache.get("key") == "value"
+    with _at(105.0):
+        assert cache.get("key") is None
+    assert "key" not in cache._entries
+
+def test_set_refreshes_expiry():
+    """Test that setting an existing key restarts its TTL"""
+    cache = TTLCache(maxsize=10, ttl=5)
+    with _at(100.0):
+        cache.set("key", "old")
+    with _at(103.0):
+        cache.set("key", "new")
+    with _at(107.0):
+        assert cache.get("key") == "new"
+
+def test_evicts_least_recently_used_at_maxsize():
+    """Test that the least recently used entry is evicted once maxsize is exceeded"""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+def test_invalidate_and_clear():
+    """Test removing a single entry and removing every entry"""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.invalidate("a")
+    cache.invalidate("missing")
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.clear()
+
+    assert cache.get("b") is None